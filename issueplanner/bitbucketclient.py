@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import sys
@@ -25,14 +26,24 @@ class BitbucketClient(object):
         """
 
         batch = 25
-        start = 0
-        count = batch
-        while start < count:
-            s,resp = self._bb.issue.all(owner=owner, repo_slug=slug, params={'start': start, 'limit': batch})
-            if not s:
-                raise Exception("failed to get issues for {account}/{slug}".format(account=account, slug=slug))
-            for r in resp["issues"]:
-                yield r
-            count = resp["count"]
-            start += batch
+
+        # the first batch tells us how many issues there are; the
+        # remaining batches are fetched concurrently and yielded in order
+        resp = self._get_issues_batch(owner, slug, start=0, limit=batch)
+        for r in resp["issues"]:
+            yield r
+
+        starts = range(batch, resp.get("count", 0), batch)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resps = executor.map(lambda start: self._get_issues_batch(owner, slug, start=start, limit=batch),
+                                 starts)
+            for resp in resps:
+                for r in resp["issues"]:
+                    yield r
         # no return
+
+    def _get_issues_batch(self, owner, slug, start, limit):
+        s,resp = self._bb.issue.all(owner=owner, repo_slug=slug, params={'start': start, 'limit': limit})
+        if not s:
+            raise Exception("failed to get issues for {owner}/{slug}".format(owner=owner, slug=slug))
+        return resp
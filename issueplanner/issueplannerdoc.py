@@ -36,6 +36,11 @@ class IssuePlannerDoc(PlannerDoc):
 
     """
 
+    def __init__(self, xml_root):
+        super(IssuePlannerDoc, self).__init__(xml_root)
+        self._max_task_id = max([0] + [int(te.get("id")) for te in self._xml_root.iter("task")])
+        self._child_task_index = {}
+
     def get_trackers(self):
         """Return a list of issue prefixes and the associated repo issue tracker.
 
@@ -59,18 +64,17 @@ class IssuePlannerDoc(PlannerDoc):
 
         """
 
-        def _mk_ti(e):
-            ti = parse_tracker_spec(e.get("description"))
-            if ti:
-                ti.update({"prefix": e.get("name")})
-            return ti
-
-        trackers = [ti
-                    for ti in (_mk_ti(e)
-                               for e in self._xml_root.xpath('/project/properties/property[@description]'))
-                    if ti is not None]
-        
-
+        trackers = []
+        for props_e in self._xml_root.iterchildren("properties"):
+            for e in props_e.iterchildren("property"):
+                desc = e.get("description")
+                if not desc:
+                    continue
+                ti = parse_tracker_spec(desc)
+                if ti is None:
+                    continue
+                ti["prefix"] = e.get("name")
+                trackers.append(ti)
         return trackers
 
 
@@ -83,7 +87,7 @@ class IssuePlannerDoc(PlannerDoc):
         """
     
         fqrn = "{tracker[owner]}/{tracker[slug]}".format(tracker=tracker)
-        tasks_te =  self._xml_root.xpath("/project/tasks")[0]
+        tasks_te =  self._xml_root.find("tasks")
         return self.get_task_path(tasks_te, [fqrn])
 
 
@@ -114,22 +118,42 @@ class IssuePlannerDoc(PlannerDoc):
         """
 
         for name in names:
-            elms = parent_te.xpath("task[@name='{name}']".format(name=name))
+            index = self._children_by_name(parent_te)
+            elms = index.get(name)
+            if not elms or any(e.getparent() is not parent_te or e.get("name") != name for e in elms):
+                # the tree may have been modified outside this class
+                index = self._children_by_name(parent_te, refresh=True)
+                elms = index.get(name, [])
             if len(elms) >= 2:
-                raise Exception("Found multiple tasks named {fqrn}".format(fqrn))
+                raise Exception("Found multiple tasks named {name}".format(name=name))
             if len(elms) == 0:
                 child_te = self.create_task(name)
                 parent_te.append(child_te)
+                index[name] = [child_te]
             elif len(elms) == 1:
                 child_te = elms[0]
             parent_te = child_te
         return child_te
 
 
+    def _children_by_name(self, parent_te, refresh=False):
+        """return a cached dict of name => list of child task elements
+        of parent_te, rebuilding it if `refresh` is True
+        """
+
+        index = self._child_task_index.get(parent_te)
+        if index is None or refresh:
+            index = {}
+            for te in parent_te.iterchildren("task"):
+                index.setdefault(te.get("name"), []).append(te)
+            self._child_task_index[parent_te] = index
+        return index
+
+
     def create_task(self, name, attrs={}):
         def _get_next_task_id():
-            max_task_id = max(int(e.get("id")) for e in self._xml_root.xpath("///task"))
-            return max_task_id + 1
+            self._max_task_id += 1
+            return self._max_task_id
 
         _attrs = {
             "id": str(_get_next_task_id()),
@@ -152,16 +176,16 @@ class IssuePlannerDoc(PlannerDoc):
     def set_task_constraint(self, te, ctype, ts):
         ce = te.find("constraint")
         if ce is None:
-            ce = self._xml_root.makeelement("constraint")
+            ce = self._xml_root.makeelement("constraint", {"type": ctype, "time": ts})
             te.append(ce)
-        ce.set("type", "start-no-earlier-than")
-        ce.set("time", ts)
+        else:
+            ce.attrib.update({"type": ctype, "time": ts})
 
     def reset_project_start(self):
         """
         The project start date 
         """
-        earliest_ts = sorted(ts for ts in self._xml_root.xpath("///task/@start") if ts != "")[0]
+        earliest_ts = min(ts for ts in (te.get("start") for te in self._xml_root.iter("task")) if ts)
         assert self._xml_root.tag == "project"
         self._xml_root.set("project-start", earliest_ts)
         return earliest_ts
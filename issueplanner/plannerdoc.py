@@ -8,6 +8,11 @@ import os
 import lxml.etree as le
 
 
+_xp_allocations = le.XPath("/project/allocations/allocation")
+_xp_properties = le.XPath("/project/properties/property")
+_xp_resources = le.XPath("/project/resources/resource")
+
+
 class PlannerDoc(object):
     """Facade to read, write, and manipulate GNOME Planner XML documents.
     This class is intended to be independent of the issueplanner tools.
@@ -31,17 +36,23 @@ class PlannerDoc(object):
         return le.tostring(self._xml_root, encoding="unicode",
                            pretty_print=True)
 
+    def write(self, fh):
+        """serialize the document to the binary file-like object `fh`
+        without building the whole document as a string first"""
+        self._xml_root.getroottree().write(fh, encoding="UTF-8", xml_declaration=True,
+                                           pretty_print=True)
+
     def allocations(self):
-        return self._xml_root.xpath("/project/allocations/allocation")
+        return _xp_allocations(self._xml_root)
 
     def properties(self):
-        return self._xml_root.xpath("/project/properties/property")
+        return _xp_properties(self._xml_root)
 
     def resources(self):
-        return self._xml_root.xpath("/project/resources/resource")
+        return _xp_resources(self._xml_root)
 
     def tasks(self):
-        return self._xml_root.xpath("/project/tasks//task")
+        return list(self._xml_root.iter("task"))
 
 
 
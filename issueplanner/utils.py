@@ -5,10 +5,20 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 __doc__ = """Utilities for issueplanner"""
 
+from datetime import datetime
 from math import ceil
 import re
 
-import arrow
+try:
+    from functools import lru_cache
+except ImportError:             # Python 2
+    def lru_cache(maxsize=128):
+        return lambda f: f
+
+try:
+    from types import MappingProxyType
+except ImportError:             # Python 2
+    MappingProxyType = dict
 
 
 completed_statuses = ['resolved', 'closed', 'invalid', 'wontfix', 'duplicate']
@@ -31,8 +41,12 @@ priority_map = {
     "critical": {"level": 2, "symbol": "\u278B"},  # ➋
     "blocker":  {"level": 1, "symbol": "\u278A"},  # ➊
     }
-priority_status_map = {n:d["symbol"] for n,d in priority_map.iteritems()}
-priority_level_map = {n:d["level"] for n,d in priority_map.iteritems()}
+# derived, read-only lookup tables
+priority_status_map = MappingProxyType({n:d["symbol"] for n,d in priority_map.items()})
+priority_level_map = MappingProxyType({n:d["level"] for n,d in priority_map.items()})
+status_level_map = MappingProxyType({n:d["level"] for n,d in status_map.items()})
+
+_tracker_spec_re = re.compile(r"(?P<scm>\w+):(?P<owner>\w+)/(?P<slug>\w+)$")
 
 
 def bb_to_planner_ts(ts):
@@ -46,7 +60,22 @@ def bb_to_planner_ts(ts):
 
     """
 
-    return ts.partition("+")[0].partition(".")[0].replace("-","").replace(":","").replace(" ","T") + "Z"
+    # bitbucket timestamps always begin with a fixed-width
+    # YYYY-MM-DD[T ]HH:MM:SS prefix; anything after is ignored
+    return ts[0:4] + ts[5:7] + ts[8:10] + "T" + ts[11:13] + ts[14:16] + ts[17:19] + "Z"
+
+
+def _parse_bb_ts(ts):
+    """parse a bitbucket (UTC) timestamp into a naive datetime; see
+    bb_to_planner_ts for the expected format
+
+    >>> _parse_bb_ts('2015-06-02 21:16:26+00:00')
+    datetime.datetime(2015, 6, 2, 21, 16, 26)
+
+    """
+
+    return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                    int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
 
 
 def parse_tracker_spec(ts_string):
@@ -73,12 +102,18 @@ def parse_tracker_spec(ts_string):
 
     """
 
-    tracker_spec_re = re.compile(u"(?P<scm>\w+):(?P<owner>\w+)/(?P<slug>\w+)$")
-
-    try:
-        return tracker_spec_re.match(ts_string).groupdict()
-    except AttributeError:
+    parts = _parse_tracker_spec(ts_string)
+    if parts is None:
         return None
+    return dict(zip(("scm", "owner", "slug"), parts))
+
+
+@lru_cache(maxsize=128)
+def _parse_tracker_spec(ts_string):
+    # returns an immutable (scm, owner, slug) tuple so that cached
+    # results can't be modified by callers of parse_tracker_spec
+    m = _tracker_spec_re.match(ts_string)
+    return m.groups() if m else None
 
 
 def milestone_path_names(milestone):
@@ -89,7 +124,11 @@ def milestone_path_names(milestone):
 
     """
     ms_elements = milestone.split(".")
-    names = [".".join(ms_elements[0:i+1]) for i in range(1,len(ms_elements))]
+    names = []
+    name = ms_elements[0]
+    for e in ms_elements[1:]:
+        name = name + "." + e
+        names.append(name)
     return names
     
 
@@ -102,8 +141,8 @@ def issue_elapsed_work_seconds(issue):
     elapsed_to_work_factor = (8 * 5) / (24 * 7)  #  work 40h/168h per week
     seconds_per_workday = 8 * hour_s
 
-    elapsed = arrow.get(issue["utc_last_updated"]) - arrow.get(issue["utc_created_on"])
-    elapsed_s = elapsed.seconds
+    elapsed = _parse_bb_ts(issue["utc_last_updated"]) - _parse_bb_ts(issue["utc_created_on"])
+    elapsed_s = elapsed.total_seconds()
     elapsed_work_s = elapsed_s if elapsed_s <= seconds_per_workday else elapsed_s * elapsed_to_work_factor
     elapsed_work_s = ceil(elapsed_work_s / hour_s) * hour_s
 
@@ -116,6 +155,20 @@ def issue_status_symbols(issue):
         st = status_map[issue["status"]]["symbol"])
 
 def issue_sort_key(i):
-    return (status_map[i["status"]]["level"],
-            priority_map[i["priority"]]["level"],
+    return (status_level_map[i["status"]],
+            priority_level_map[i["priority"]],
             int(i["local_id"]))
+
+def sort_issues(issues):
+    """return a new list of issues ordered by issue_sort_key
+
+    >>> issues = [
+    ...     {"status": "closed", "priority": "major", "local_id": "3"},
+    ...     {"status": "new", "priority": "minor", "local_id": "2"},
+    ...     {"status": "new", "priority": "blocker", "local_id": "10"},
+    ...     ]
+    >>> [i["local_id"] for i in sort_issues(issues)]
+    ['10', '2', '3']
+
+    """
+    return sorted(issues, key=issue_sort_key)